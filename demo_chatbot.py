@@ -21,9 +21,12 @@ from __future__ import annotations
 
 import argparse
 import logging
+import queue
 import sys
-import time
-from typing import Optional
+import threading
+import urllib.request
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -34,16 +37,132 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from selenium_chatbot_test import StreamWaiter, SemanticAssert, LatencyMonitor
+if TYPE_CHECKING:
+    from selenium_chatbot_test import SemanticAssert
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
+# Local HTML page with simulated streaming, used by demo_local_simulation
+_DEMO_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Streaming Demo</title>
+    <style>
+        body { font-family: Arial, sans-serif; padding: 20px; background: #1a1a2e; color: #eee; }
+        #chat-container { max-width: 600px; margin: 0 auto; }
+        #input-area { display: flex; gap: 10px; margin-bottom: 20px; }
+        #user-input { flex: 1; padding: 10px; border-radius: 5px; border: none; }
+        #send-btn { padding: 10px 20px; background: #4a90d9; color: white; border: none; border-radius: 5px; cursor: pointer; }
+        #response-box { 
+            background: #16213e; 
+            padding: 20px; 
+            border-radius: 10px; 
+            min-height: 100px;
+            white-space: pre-wrap;
+        }
+        .cursor { animation: blink 1s infinite; }
+        @keyframes blink { 0%, 50% { opacity: 1; } 51%, 100% { opacity: 0; } }
+    </style>
+</head>
+<body>
+    <div id="chat-container">
+        <h1>🤖 Streaming Chat Demo</h1>
+        <div id="input-area">
+            <input type="text" id="user-input" placeholder="Type a message...">
+            <button id="send-btn">Send</button>
+        </div>
+        <div id="response-box"></div>
+    </div>
+    
+    <script>
+        const responses = {
+            'hello': 'Hello! How can I assist you today? I am a helpful AI assistant ready to answer your questions.',
+            'hi': 'Hi there! Great to meet you. How may I help you?',
+            'default': 'Thank you for your message. I understand you said: "{input}". How can I help you further?'
+        };
+        
+        function simulateStreaming(text, element) {
+            element.textContent = '';
+            let index = 0;
+            let lastTime = performance.now();
+            
+            function addChunk(now) {
+                if (index < text.length) {
+                    // Append a batch of characters per animation frame,
+                    // sized by the time elapsed since the previous frame
+                    const chunkSize = Math.max(1, Math.floor((now - lastTime) / 5));
+                    element.textContent += text.slice(index, index + chunkSize);
+                    index += chunkSize;
+                    lastTime = now;
+                    
+                    requestAnimationFrame(addChunk);
+                }
+            }
+            
+            requestAnimationFrame(addChunk);
+        }
+        
+        document.getElementById('send-btn').addEventListener('click', function() {
+            const input = document.getElementById('user-input').value.toLowerCase().trim();
+            const responseBox = document.getElementById('response-box');
+            
+            let response = responses[input] || responses['default'].replace('{input}', input);
+            simulateStreaming(response, responseBox);
+        });
+        
+        document.getElementById('user-input').addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                document.getElementById('send-btn').click();
+            }
+        });
+    </script>
+</body>
+</html>
+"""
+
+# Percent-encode once at import time rather than on every demo run. Newlines
+# and tabs must be encoded: URL parsing strips them raw, which would break
+# the inline script's // comments.
+_DEMO_DATA_URL = "data:text/html;charset=utf-8," + quote(
+    _DEMO_HTML, safe="/:;=,()[]{}<>'\" "
+)
+
+# Invariant locators and strings shared across demo runs
+_RESPONSE_LOCATOR = (By.ID, "response-box")
+# Must stay a CSS selector: the stream-timeout fallback in
+# demo_with_gradio_textbox passes its value to document.querySelector
+_OUTPUT_LOCATOR = (By.CSS_SELECTOR, ".output-class, .output-text, .prose, [data-testid='output']")
+assert _OUTPUT_LOCATOR[0] == By.CSS_SELECTOR
+_EXPECTED_REPLY = sys.intern("Hello, how can I help you today?")
+_SEPARATOR = "=" * 60
+
+# Shared SemanticAssert so its embedding cache persists across demo runs
+_asserter: Optional[SemanticAssert] = None
+
+# JS equivalent of EC.element_to_be_clickable, for batched element lookups.
+# getClientRects() is used for visibility since offsetParent is always null
+# for position: fixed elements.
+_IS_CLICKABLE_JS = (
+    "const isClickable = (el) =>"
+    " !!el && !el.disabled && el.getClientRects().length > 0;"
+)
+
+# Detects a login prompt in a single pass: an explicit login affordance, or a
+# link/button whose text matches one case-insensitive regex
+_LOGIN_PROBE_SCRIPT = """
+const loginRe = /sign\\s*in|log\\s*in/i;
+if (document.querySelector('a[href*="login"], button[data-login], [aria-label*="Sign in" i]')) {
+    return true;
+}
+return Array.prototype.some.call(
+    document.querySelectorAll('a, button'),
+    (el) => loginRe.test(el.textContent)
+);
+"""
+
+
 def create_driver(headless: bool = False) -> webdriver.Chrome:
     """
     Create a Chrome WebDriver instance.
@@ -64,16 +183,79 @@ def create_driver(headless: bool = False) -> webdriver.Chrome:
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     
+    # Keep Chrome's on-disk caches from growing across repeated runs
+    options.add_argument("--disk-cache-size=0")
+    options.add_argument("--media-cache-size=0")
+    
+    # Skip background services that slow startup and perturb latency metrics
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-client-side-phishing-detection")
+    options.add_argument("--metrics-recording-only")
+    options.add_argument("--no-first-run")
+    options.add_argument("--disable-features=Translate,BackForwardCache,MediaRouter")
+    
     # Suppress logging
     options.add_argument("--log-level=3")
     options.add_experimental_option("excludeSwitches", ["enable-logging"])
     
+    # Return from driver.get() at DOMContentLoaded instead of window.onload
+    options.page_load_strategy = "eager"
+    
     driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+    # Rely on explicit WebDriverWait calls only; a non-zero implicit wait
+    # would be applied to every find_element and stack on top of them.
+    driver.implicitly_wait(0)
     
     return driver
 
 
+def _hf_reachable() -> bool:
+    """
+    Check whether HuggingFace Chat responds, without starting a navigation.
+    
+    Returns:
+        True if a HEAD request to the chat page succeeds, False otherwise.
+    """
+    try:
+        request = urllib.request.Request("https://huggingface.co/chat/", method="HEAD")
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def _get_asserter() -> SemanticAssert:
+    """
+    Get the shared SemanticAssert instance, creating it on first use.
+    
+    Returns:
+        SemanticAssert instance whose embedding cache is reused across runs.
+    """
+    global _asserter
+    if _asserter is None:
+        from selenium_chatbot_test import SemanticAssert
+        
+        _asserter = SemanticAssert()
+    return _asserter
+
+
+def _reset_browser(driver: webdriver.Chrome) -> None:
+    """
+    Release resources held by the previous page before reusing the driver.
+    
+    Clears the network cache and navigates to about:blank so sockets and
+    page memory from an abandoned navigation are not carried over.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    except WebDriverException as e:
+        logger.debug("Could not clear browser cache: %s", e)
+    driver.get("about:blank")
+
+
 def demo_huggingface_chat(driver: webdriver.Chrome) -> bool:
     """
     Demo using HuggingFace Chat (if accessible).
@@ -85,11 +267,11 @@ def demo_huggingface_chat(driver: webdriver.Chrome) -> bool:
     
     try:
         driver.get("https://huggingface.co/chat/")
-        time.sleep(3)  # Allow page to load
         
-        # Check if we're blocked or need to login
-        page_source = driver.page_source.lower()
-        if "sign in" in page_source or "login" in page_source:
+        # Check if we're blocked or need to login. Query the DOM in the
+        # browser rather than pulling the whole page_source over the wire.
+        needs_login = driver.execute_script(_LOGIN_PROBE_SCRIPT)
+        if needs_login:
             logger.warning("HuggingFace Chat requires login, skipping...")
             return False
         
@@ -105,7 +287,7 @@ def demo_huggingface_chat(driver: webdriver.Chrome) -> bool:
         return True
         
     except Exception as e:
-        logger.warning(f"HuggingFace Chat not accessible: {e}")
+        logger.warning("HuggingFace Chat not accessible: %s", e)
         return False
 
 
@@ -119,38 +301,41 @@ def demo_with_gradio_textbox(driver: webdriver.Chrome) -> None:
     # This is a fallback demo that simulates the streaming behavior
     demo_url = "https://huggingface.co/spaces/gradio/hello_world"
     
-    logger.info(f"Opening demo at: {demo_url}")
+    logger.info("Opening demo at: %s", demo_url)
     driver.get(demo_url)
     
-    # Wait for the Gradio interface to load
-    time.sleep(5)
-    
     try:
-        # Look for the Gradio frame (embedded spaces use iframes)
-        frames = driver.find_elements(By.TAG_NAME, "iframe")
-        if frames:
-            driver.switch_to.frame(frames[0])
+        # Look for the Gradio frame (embedded spaces use iframes). It is part
+        # of the served HTML, so a short wait suffices before falling back.
+        try:
+            WebDriverWait(driver, 2).until(
+                EC.frame_to_be_available_and_switch_to_it((By.TAG_NAME, "iframe"))
+            )
             logger.info("Switched to Gradio iframe")
+        except TimeoutException:
+            logger.info("No Gradio iframe found, using top-level document")
         
-        # Find the input textbox
-        input_box = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text'], textarea"))
+        # Find the input textbox and submit button in one round-trip,
+        # once both are visible and enabled
+        input_box, submit_btn = WebDriverWait(driver, 15).until(
+            lambda d: d.execute_script(
+                _IS_CLICKABLE_JS
+                + "const input = document.querySelector(\"input[type='text'], textarea\");"
+                "const submit = document.querySelector(\"button.primary, button[type='submit']\");"
+                "return isClickable(input) && isClickable(submit) ? [input, submit] : null;"
+            )
         )
         
         logger.info("Found input element, entering text...")
         input_box.clear()
         input_box.send_keys("Hello")
         
-        # Find and click submit button
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "button.primary, button[type='submit']")
-        
-        # Set up latency monitoring on the output area
-        output_locator = (By.CSS_SELECTOR, ".output-class, .output-text, .prose, [data-testid='output']")
+        from selenium_chatbot_test import LatencyMonitor, StreamWaiter
         
         waiter = StreamWaiter()
-        asserter = SemanticAssert()
         
-        with LatencyMonitor(driver, output_locator) as monitor:
+        # Set up latency monitoring on the output area
+        with LatencyMonitor(driver, _OUTPUT_LOCATOR) as monitor:
             submit_btn.click()
             logger.info("Clicked submit, waiting for response...")
             
@@ -158,21 +343,40 @@ def demo_with_gradio_textbox(driver: webdriver.Chrome) -> None:
             try:
                 element = waiter.wait_for_stream_end(
                     driver, 
-                    output_locator,
+                    _OUTPUT_LOCATOR,
                     silence_timeout=1.0,
                     timeout=30.0
                 )
-                response_text = element.text
+                response_text = driver.execute_script(
+                    "return arguments[0].textContent;", element
+                )
             except TimeoutException:
-                # Fallback: just get current text
-                output_element = driver.find_element(*output_locator)
-                response_text = output_element.text
+                # Fallback: just get current text in a single round-trip
+                response_text = driver.execute_script(
+                    "const el = document.querySelector(arguments[0]);"
+                    "return el ? el.textContent : null;",
+                    _OUTPUT_LOCATOR[1],
+                )
+                if response_text is None:
+                    logger.warning(
+                        "Output element not found: %s=%s", *_OUTPUT_LOCATOR
+                    )
+                    response_text = ""
         
-        logger.info(f"Response received: {response_text[:100]}...")
-        logger.info(f"TTFT: {monitor.metrics.ttft_ms:.1f}ms" if monitor.metrics.ttft_ms else "TTFT: N/A")
-        logger.info(f"Total latency: {monitor.metrics.total_ms:.1f}ms" if monitor.metrics.total_ms else "Total: N/A")
+        metrics = monitor.metrics
+        ttft, total = metrics.ttft_ms, metrics.total_ms
+        logger.info("Response received: %.100s...", response_text)
+        if ttft:
+            logger.info("TTFT: %.1fms", ttft)
+        else:
+            logger.info("TTFT: N/A")
+        if total:
+            logger.info("Total latency: %.1fms", total)
+        else:
+            logger.info("Total: N/A")
         
         # Semantic assertion (relaxed for simple demo)
+        asserter = _get_asserter()
         try:
             asserter.assert_similarity(
                 response_text,
@@ -181,10 +385,10 @@ def demo_with_gradio_textbox(driver: webdriver.Chrome) -> None:
             )
             logger.info("✓ Semantic assertion passed!")
         except AssertionError as e:
-            logger.warning(f"Semantic assertion failed (expected for simple demo): {e}")
+            logger.warning("Semantic assertion failed (expected for simple demo): %s", e)
         
     except Exception as e:
-        logger.error(f"Demo error: {e}")
+        logger.error("Demo error: %s", e)
         raise
 
 
@@ -197,96 +401,23 @@ def demo_local_simulation(driver: webdriver.Chrome) -> None:
     """
     logger.info("Running local streaming simulation demo...")
     
-    # Create a local HTML page with simulated streaming
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Streaming Demo</title>
-        <style>
-            body { font-family: Arial, sans-serif; padding: 20px; background: #1a1a2e; color: #eee; }
-            #chat-container { max-width: 600px; margin: 0 auto; }
-            #input-area { display: flex; gap: 10px; margin-bottom: 20px; }
-            #user-input { flex: 1; padding: 10px; border-radius: 5px; border: none; }
-            #send-btn { padding: 10px 20px; background: #4a90d9; color: white; border: none; border-radius: 5px; cursor: pointer; }
-            #response-box { 
-                background: #16213e; 
-                padding: 20px; 
-                border-radius: 10px; 
-                min-height: 100px;
-                white-space: pre-wrap;
-            }
-            .cursor { animation: blink 1s infinite; }
-            @keyframes blink { 0%, 50% { opacity: 1; } 51%, 100% { opacity: 0; } }
-        </style>
-    </head>
-    <body>
-        <div id="chat-container">
-            <h1>🤖 Streaming Chat Demo</h1>
-            <div id="input-area">
-                <input type="text" id="user-input" placeholder="Type a message...">
-                <button id="send-btn">Send</button>
-            </div>
-            <div id="response-box"></div>
-        </div>
-        
-        <script>
-            const responses = {
-                'hello': 'Hello! How can I assist you today? I am a helpful AI assistant ready to answer your questions.',
-                'hi': 'Hi there! Great to meet you. How may I help you?',
-                'default': 'Thank you for your message. I understand you said: "{input}". How can I help you further?'
-            };
-            
-            function simulateStreaming(text, element) {
-                element.textContent = '';
-                let index = 0;
-                
-                function addChar() {
-                    if (index < text.length) {
-                        // Add 1-3 characters at a time to simulate token streaming
-                        const chunkSize = Math.floor(Math.random() * 3) + 1;
-                        element.textContent += text.slice(index, index + chunkSize);
-                        index += chunkSize;
-                        
-                        // Variable delay to simulate realistic streaming
-                        const delay = Math.random() * 50 + 20;
-                        setTimeout(addChar, delay);
-                    }
-                }
-                
-                addChar();
-            }
-            
-            document.getElementById('send-btn').addEventListener('click', function() {
-                const input = document.getElementById('user-input').value.toLowerCase().trim();
-                const responseBox = document.getElementById('response-box');
-                
-                let response = responses[input] || responses['default'].replace('{input}', input);
-                simulateStreaming(response, responseBox);
-            });
-            
-            document.getElementById('user-input').addEventListener('keypress', function(e) {
-                if (e.key === 'Enter') {
-                    document.getElementById('send-btn').click();
-                }
-            });
-        </script>
-    </body>
-    </html>
-    """
+    # Navigate to the simulated chat page
+    driver.get(_DEMO_DATA_URL)
     
-    # Navigate to the data URL
-    driver.get("data:text/html;charset=utf-8," + html_content.replace("#", "%23"))
-    time.sleep(1)
+    # Import lazily so modes that never reach this demo skip the import cost
+    from selenium_chatbot_test import LatencyMonitor, StreamWaiter
     
-    # Initialize our library components
     waiter = StreamWaiter()
-    asserter = SemanticAssert()
     
-    # Find elements
-    input_box = driver.find_element(By.ID, "user-input")
-    send_btn = driver.find_element(By.ID, "send-btn")
-    response_locator = (By.ID, "response-box")
+    # Find both elements in a single script round-trip, once clickable
+    input_box, send_btn = WebDriverWait(driver, 5).until(
+        lambda d: d.execute_script(
+            _IS_CLICKABLE_JS
+            + "const input = document.getElementById('user-input');"
+            "const send = document.getElementById('send-btn');"
+            "return isClickable(input) && isClickable(send) ? [input, send] : null;"
+        )
+    )
     
     # Enter message
     input_box.send_keys("Hello")
@@ -294,44 +425,43 @@ def demo_local_simulation(driver: webdriver.Chrome) -> None:
     logger.info("Sending 'Hello' message...")
     
     # Start monitoring and send message
-    with LatencyMonitor(driver, response_locator) as monitor:
+    with LatencyMonitor(driver, _RESPONSE_LOCATOR) as monitor:
         send_btn.click()
         
         # Wait for streaming to complete
         response_element = waiter.wait_for_stream_end(
             driver,
-            response_locator,
+            _RESPONSE_LOCATOR,
             silence_timeout=0.3,  # Short timeout for local demo
             timeout=10.0
         )
         
-        response_text = response_element.text
-    
-    # Display results
-    print("\n" + "=" * 60)
-    print("📊 DEMO RESULTS")
-    print("=" * 60)
-    print(f"\n📝 Response: {response_text}")
-    print(f"\n⏱️  TTFT (Time-To-First-Token): {monitor.metrics.ttft_ms:.1f}ms" if monitor.metrics.ttft_ms else "\n⏱️  TTFT: N/A")
-    print(f"⏱️  Total Latency: {monitor.metrics.total_ms:.1f}ms" if monitor.metrics.total_ms else "⏱️  Total: N/A")
-    print(f"📈 Mutation Count: {monitor.metrics.token_count}")
-    
-    # Semantic assertion
-    expected = "Hello, how can I help you today?"
-    score = asserter.get_similarity_score(response_text, expected)
-    print(f"\n🎯 Semantic Similarity Score: {score:.2%}")
-    
-    try:
-        asserter.assert_similarity(
-            response_text,
-            expected,
-            min_score=0.5
+        response_text = driver.execute_script(
+            "return arguments[0].textContent;", response_element
         )
-        print("✅ Semantic assertion PASSED!")
-    except AssertionError as e:
-        print(f"❌ Semantic assertion failed: {e}")
     
-    print("\n" + "=" * 60)
+    metrics = monitor.metrics
+    ttft, total, tokens = metrics.ttft_ms, metrics.total_ms, metrics.token_count
+    
+    # Semantic assertion (score once, then compare against the threshold)
+    min_score = 0.5
+    asserter = _get_asserter()
+    score = asserter.get_similarity_score(response_text, _EXPECTED_REPLY)
+    
+    # Display results in a single write
+    lines = [
+        "\n", _SEPARATOR, "\n📊 DEMO RESULTS\n", _SEPARATOR, "\n",
+        f"\n📝 Response: {response_text}\n",
+        f"\n⏱️  TTFT (Time-To-First-Token): {ttft:.1f}ms\n" if ttft else "\n⏱️  TTFT: N/A\n",
+        f"⏱️  Total Latency: {total:.1f}ms\n" if total else "⏱️  Total: N/A\n",
+        f"📈 Mutation Count: {tokens}\n",
+        f"\n🎯 Semantic Similarity Score: {score:.2%}\n",
+        "✅ Semantic assertion PASSED!\n" if score >= min_score
+        else f"❌ Semantic assertion failed: score={score:.2%} (required: >= {min_score:.0%})\n",
+        "\n", _SEPARATOR, "\n",
+    ]
+    sys.stdout.writelines(lines)
+    sys.stdout.flush()
 
 
 def main():
@@ -359,7 +489,22 @@ def main():
         logger.info("Starting selenium-chatbot-test demo...")
         logger.info("Creating Chrome WebDriver...")
         
-        driver = create_driver(headless=args.headless)
+        hf_ok = False
+        if args.mode != "auto":
+            driver = create_driver(headless=args.headless)
+        else:
+            # Probe HuggingFace while Chrome is starting up. A daemon thread
+            # is used so a stalled probe (e.g. slow DNS, which urlopen's
+            # timeout does not cover) cannot hold the process open at exit.
+            hf_result: queue.Queue[bool] = queue.Queue(maxsize=1)
+            threading.Thread(
+                target=lambda: hf_result.put(_hf_reachable()), daemon=True
+            ).start()
+            driver = create_driver(headless=args.headless)
+            try:
+                hf_ok = hf_result.get(timeout=3)
+            except queue.Empty:
+                logger.warning("HuggingFace reachability probe timed out")
         
         if args.mode == "local":
             demo_local_simulation(driver)
@@ -368,15 +513,22 @@ def main():
                 demo_with_gradio_textbox(driver)
             else:
                 logger.info("Falling back to local simulation...")
+                _reset_browser(driver)
                 demo_local_simulation(driver)
         else:  # auto
-            if not demo_huggingface_chat(driver):
+            if not hf_ok:
+                logger.warning(
+                    "HuggingFace Chat not reachable, running local simulation instead"
+                )
+                demo_local_simulation(driver)
+            elif not demo_huggingface_chat(driver):
+                _reset_browser(driver)
                 demo_local_simulation(driver)
         
         logger.info("Demo completed successfully!")
         
     except WebDriverException as e:
-        logger.error(f"WebDriver error: {e}")
+        logger.error("WebDriver error: %s", e)
         logger.error("Make sure Chrome is installed and chromedriver is in PATH")
         sys.exit(1)
         
@@ -384,7 +536,7 @@ def main():
         logger.info("Demo interrupted by user")
         
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
+        logger.error("Demo failed: %s", e)
         raise
         
     finally:
@@ -397,4 +549,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        force=True,
+    )
     main()
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 import numpy as np
 
@@ -131,11 +132,19 @@ class SemanticAssert:
         The sentence-transformer model is loaded lazily on first call to
         assert_similarity(), not at import time. The first call may be slower
         if the model needs to be downloaded.
+
+        Embeddings are cached per instance, so reusing one SemanticAssert
+        for repeated comparisons against the same expected text skips
+        re-encoding it.
     """
 
+    # Maximum number of text embeddings kept in each instance's cache
+    _EMBEDDING_CACHE_SIZE = 256
+
     def __init__(self) -> None:
         """Initialize SemanticAssert."""
         self._model_loader = _ModelLoader()
+        self._embedding_cache: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
 
     def assert_similarity(
         self,
@@ -180,12 +189,10 @@ class SemanticAssert:
         if not 0.0 <= min_score <= 1.0:
             raise ValueError(f"min_score must be between 0.0 and 1.0, got {min_score}")
 
-        model = self._model_loader.get_model(model_name)
-
         # Generate embeddings
-        embeddings = model.encode([actual, expected], convert_to_numpy=True)
-        actual_embedding = embeddings[0]
-        expected_embedding = embeddings[1]
+        actual_embedding, expected_embedding = self._embed_pair(
+            actual, expected, model_name
+        )
 
         # Calculate cosine similarity
         score = self._cosine_similarity(actual_embedding, expected_embedding)
@@ -208,6 +215,43 @@ class SemanticAssert:
                 f"Expected: {expected_preview!r}"
             )
 
+    def _embed_pair(
+        self, text1: str, text2: str, model_name: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get embeddings for two texts, reusing cached embeddings when possible.
+
+        Texts missing from the cache are encoded together in a single batch.
+        The cache is bounded to _EMBEDDING_CACHE_SIZE entries and evicts the
+        least recently used embedding first.
+
+        Args:
+            text1: First text to embed.
+            text2: Second text to embed.
+            model_name: The sentence-transformer model to use.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Embeddings for text1 and text2.
+        """
+        cache = self._embedding_cache
+        keys = ((model_name, text1), (model_name, text2))
+
+        missing = [key for key in dict.fromkeys(keys) if key not in cache]
+        if missing:
+            model = self._model_loader.get_model(model_name)
+            embeddings = model.encode(
+                [text for _, text in missing], convert_to_numpy=True
+            )
+            for key, embedding in zip(missing, embeddings):
+                cache[key] = embedding
+
+        for key in keys:
+            cache.move_to_end(key)
+        while len(cache) > self._EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return cache[keys[0]], cache[keys[1]]
+
     @staticmethod
     def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -254,6 +298,5 @@ class SemanticAssert:
             ... )
             >>> print(f"Similarity: {score:.2%}")
         """
-        model = self._model_loader.get_model(model_name)
-        embeddings = model.encode([text1, text2], convert_to_numpy=True)
-        return self._cosine_similarity(embeddings[0], embeddings[1])
+        embedding1, embedding2 = self._embed_pair(text1, text2, model_name)
+        return self._cosine_similarity(embedding1, embedding2)
@@ -72,7 +72,7 @@ class LatencyMonitor:
     """
 
     # JavaScript to inject the latency monitoring observer
-    _INJECT_OBSERVER_SCRIPT = """
+    _INJECT_OBSERVER_SCRIPT = """// kind:latency_inject
     const locatorType = arguments[0];
     const locatorValue = arguments[1];
     
@@ -141,7 +141,7 @@ class LatencyMonitor:
     """
 
     # JavaScript to retrieve metrics and disconnect observer
-    _RETRIEVE_METRICS_SCRIPT = """
+    _RETRIEVE_METRICS_SCRIPT = """// kind:latency_retrieve
     const monitorKey = arguments[0];
     const state = window[monitorKey];
     
@@ -176,7 +176,7 @@ class LatencyMonitor:
     """
 
     # JavaScript to force disconnect observer (for error cases)
-    _DISCONNECT_SCRIPT = """
+    _DISCONNECT_SCRIPT = """// kind:latency_disconnect
     const monitorKey = arguments[0];
     const state = window[monitorKey];
     
@@ -42,7 +42,7 @@ class StreamWaiter:
     """
 
     # JavaScript code for MutationObserver-based stream detection
-    _OBSERVER_SCRIPT = """
+    _OBSERVER_SCRIPT = """// kind:stream_wait
     return new Promise((resolve, reject) => {
         const locatorType = arguments[0];
         const locatorValue = arguments[1];
@@ -7,7 +7,8 @@ without requiring a real browser.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -16,16 +17,33 @@ import pytest
 class MockWebElement:
     """Mock Selenium WebElement for testing."""
 
+    # Shared, read-only attribute map; the mock never sets attributes
+    _EMPTY_ATTRS: Mapping[str, str] = MappingProxyType({})
+    # Shared by the whole test session: callers must not mutate it
+    _EMPTY: Optional["MockWebElement"] = None
+
     def __init__(self, text: str = "", tag_name: str = "div"):
         self.text = text
         self.tag_name = tag_name
-        self._attributes: Dict[str, str] = {}
+        self._attributes: Mapping[str, str] = self._EMPTY_ATTRS
+
+    @classmethod
+    def _empty(cls) -> "MockWebElement":
+        """
+        Return the shared empty element, creating it on first use.
+
+        The returned element is shared across tests, so do not mutate its
+        text or tag_name.
+        """
+        if cls._EMPTY is None:
+            cls._EMPTY = cls()
+        return cls._EMPTY
 
     def get_attribute(self, name: str) -> Optional[str]:
         return self._attributes.get(name)
 
     def find_element(self, by: str, value: str) -> "MockWebElement":
-        return MockWebElement()
+        return MockWebElement._empty()
 
     def find_elements(self, by: str, value: str) -> list:
         return []
@@ -34,31 +52,36 @@ class MockWebElement:
 class MockWebDriver:
     """Mock Selenium WebDriver for testing."""
 
+    # Library scripts start with a "// kind:<name>" tag line
+    _KIND_PREFIX = "// kind:"
+
     def __init__(self):
         self._script_results: Dict[str, Any] = {}
         self._execute_script_calls: list = []
         self._current_url = "about:blank"
+        self._dispatch: Dict[str, Callable[[], Any]] = {
+            # Return element for observer scripts
+            "stream_wait": lambda: MockWebElement(text="Mocked response text"),
+            # Return monitor key for latency monitor inject
+            "latency_inject": lambda: "__latencyMonitor_test_123",
+            # Return metrics for latency monitor retrieve
+            "latency_retrieve": lambda: {
+                "startTime": 1000.0,
+                "firstMutationTime": 1050.0,
+                "lastMutationTime": 1500.0,
+                "mutationCount": 15,
+            },
+        }
 
     def execute_script(self, script: str, *args) -> Any:
         """Mock execute_script that returns pre-configured results."""
         self._execute_script_calls.append((script, args))
 
-        # Return element for observer scripts
-        if "MutationObserver" in script and "Promise" in script:
-            return MockWebElement(text="Mocked response text")
-
-        # Return monitor key for latency monitor inject
-        if "startTime: performance.now()" in script:
-            return "__latencyMonitor_test_123"
-
-        # Return metrics for latency monitor retrieve
-        if "firstMutationTime" in script and "mutationCount" in script:
-            return {
-                "startTime": 1000.0,
-                "firstMutationTime": 1050.0,
-                "lastMutationTime": 1500.0,
-                "mutationCount": 15,
-            }
+        if script.startswith(self._KIND_PREFIX):
+            kind = script[len(self._KIND_PREFIX) : script.find("\n")]
+            handler = self._dispatch.get(kind)
+            if handler is not None:
+                return handler()
 
         return self._script_results.get("default")
 
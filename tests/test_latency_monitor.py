@@ -134,6 +134,18 @@ class TestLatencyMonitorContextManager:
             script, _ = mock_driver._execute_script_calls[0]
             assert "startTime: performance.now()" in script
 
+    def test_scripts_have_kind_tags(self):
+        """Test that each injected script starts with its kind tag."""
+        assert LatencyMonitor._INJECT_OBSERVER_SCRIPT.startswith(
+            "// kind:latency_inject\n"
+        )
+        assert LatencyMonitor._RETRIEVE_METRICS_SCRIPT.startswith(
+            "// kind:latency_retrieve\n"
+        )
+        assert LatencyMonitor._DISCONNECT_SCRIPT.startswith(
+            "// kind:latency_disconnect\n"
+        )
+
 
 class TestLatencyMonitorMetrics:
     """Tests for metrics collection."""
@@ -257,6 +257,58 @@ class TestGetSimilarityScore:
             assert -1.0 <= score <= 1.0
 
 
+class TestEmbeddingCache:
+    """Tests for per-instance embedding caching."""
+
+    def test_repeated_comparison_reuses_embeddings(self):
+        """Test that comparing the same texts again does not re-encode."""
+        asserter = SemanticAssert()
+
+        with patch.object(asserter._model_loader, "get_model") as mock_get:
+            mock_model = MagicMock()
+            mock_model.encode.return_value = np.array([[1, 0], [1, 0]])
+            mock_get.return_value = mock_model
+
+            first = asserter.get_similarity_score("hello", "hi")
+            second = asserter.get_similarity_score("hello", "hi")
+
+            assert first == second
+            assert mock_model.encode.call_count == 1
+
+    def test_only_uncached_text_is_encoded(self):
+        """Test that a cached expected text is not sent to the model again."""
+        asserter = SemanticAssert()
+
+        with patch.object(asserter._model_loader, "get_model") as mock_get:
+            mock_model = MagicMock()
+            mock_model.encode.return_value = np.array([[1, 0], [1, 0]])
+            mock_get.return_value = mock_model
+
+            asserter.get_similarity_score("first", "expected")
+            mock_model.encode.return_value = np.array([[0, 1]])
+            score = asserter.get_similarity_score("second", "expected")
+
+            args, _ = mock_model.encode.call_args
+            assert args[0] == ["second"]
+            assert abs(score) < 0.0001
+
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts old entries beyond its size limit."""
+        asserter = SemanticAssert()
+        asserter._EMBEDDING_CACHE_SIZE = 2
+
+        with patch.object(asserter._model_loader, "get_model") as mock_get:
+            mock_model = MagicMock()
+            mock_model.encode.return_value = np.array([[1, 0], [1, 0]])
+            mock_get.return_value = mock_model
+
+            asserter.get_similarity_score("a", "b")
+            asserter.get_similarity_score("c", "d")
+
+            assert len(asserter._embedding_cache) == 2
+            assert ("all-MiniLM-L6-v2", "a") not in asserter._embedding_cache
+
+
 # Integration tests (require actual model - mark as slow)
 @pytest.mark.slow
 class TestSemanticAssertIntegration:
@@ -28,6 +28,10 @@ class TestStreamWaiterInit:
         assert hasattr(waiter, "_OBSERVER_SCRIPT")
         assert "MutationObserver" in waiter._OBSERVER_SCRIPT
 
+    def test_observer_script_has_kind_tag(self):
+        """Test that the observer script starts with its kind tag."""
+        assert StreamWaiter._OBSERVER_SCRIPT.startswith("// kind:stream_wait\n")
+
 
 class TestStreamWaiterValidation:
     """Tests for input validation in StreamWaiter."""